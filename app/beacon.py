@@ -3,6 +3,44 @@ import time
 
 from dicts import BEACON_PROTOCOL, BEACON_TYPE, RSSI_THRESHOLD, FACTIONS, LOCATIONS, DROIDS
 
+# ----------------------------------------------------------------------
+# Payload builders
+# ----------------------------------------------------------------------
+# (mfg_id, mfg_data) pairs keyed by (loc_id, cooldown_byte) and (p_id, aff_byte)
+_LOC_PAYLOAD_CACHE: dict[tuple, tuple] = {}
+_DROID_PAYLOAD_CACHE: dict[tuple, tuple] = {}
+
+def _split_payload(payload):
+    """Formats the hex string into the manufacturer id and data bluetoothctl expects"""
+    raw = payload.replace("0x", "").replace(" ", "").replace(",", "")
+    mfg_id = f"0x{raw[:4]}"
+    mfg_data = " ".join(f"0x{raw[i:i+2]}" for i in range(4, len(raw), 2))
+    return mfg_id, mfg_data
+
+def _build_loc_payload(loc_id, cooldown_byte):
+    """Builds the byte payload for a Location beacon"""
+    return _split_payload(
+        f"0x{BEACON_PROTOCOL['MFG_ID']:04X} "
+        f"0x{BEACON_TYPE['LOCATION']:02X} "
+        f"0x{BEACON_PROTOCOL['DATA_LEN']:02X} "
+        f"0x{loc_id:02X} "
+        f"0x{cooldown_byte:02X} "
+        f"0x{RSSI_THRESHOLD['MID']:02X} "
+        f"0x{BEACON_PROTOCOL['ACTIVE_FLAG']:02X} "
+    )
+
+def _build_droid_payload(p_id, aff_byte):
+    """Constructs the byte payload to simulate a specific droid's presence"""
+    return _split_payload(
+        f"0x{BEACON_PROTOCOL['MFG_ID']:04X} "
+        f"0x{BEACON_TYPE['DROID']:02X} "
+        f"0x{BEACON_PROTOCOL['DATA_LEN']:02X} "
+        f"0x{BEACON_PROTOCOL['DROID_HEADER']:02X} "
+        f"0x{BEACON_PROTOCOL['STATUS_FLAG']:02X} "
+        f"0x{aff_byte:02X} "
+        f"0x{p_id:02X}"
+    )
+
 # ----------------------------------------------------------------------
 # Droid Beacon (Low Level)
 # ----------------------------------------------------------------------
@@ -15,12 +53,8 @@ class DroidBeacon:
         self.stop_event = threading.Event()
         self._lock = threading.Lock()
 
-    def _send_payload(self, name, payload):
-        """Formats the hex string into raw manufacturer data and triggers the BT broadcast"""
-        raw = payload.replace("0x", "").replace(" ", "").replace(",", "")
-        mfg_id = f"0x{raw[:4]}"
-        mfg_data = " ".join(f"0x{raw[i:i+2]}" for i in range(4, len(raw), 2))
-
+    def _send_payload(self, name, mfg_id, mfg_data):
+        """Triggers the BT broadcast with prebuilt manufacturer data"""
         with self._lock:
             try:
                 self.bt.broadcast_mfg(mfg_id, mfg_data)
@@ -30,32 +64,22 @@ class DroidBeacon:
                 pass
 
     def activate_location(self, loc_id, name, cooldown_byte):
-        """Builds the byte payload for a Location beacon"""
-        payload = (
-            f"0x{BEACON_PROTOCOL['MFG_ID']:04X} "
-            f"0x{BEACON_TYPE['LOCATION']:02X} "
-            f"0x{BEACON_PROTOCOL['DATA_LEN']:02X} "
-            f"0x{loc_id:02X} "
-            f"0x{cooldown_byte:02X} "
-            f"0x{RSSI_THRESHOLD['MID']:02X} "
-            f"0x{BEACON_PROTOCOL['ACTIVE_FLAG']:02X} "
-        )
-        self._send_payload(name, payload)
+        """Broadcasts a Location beacon, formatting its payload only on first use"""
+        key = (loc_id, cooldown_byte)
+        mfg = _LOC_PAYLOAD_CACHE.get(key)
+        if mfg is None:
+            mfg = _LOC_PAYLOAD_CACHE[key] = _build_loc_payload(loc_id, cooldown_byte)
+        self._send_payload(name, *mfg)
 
     def activate_droid(self, p_id, p_name, faction_name):
-        """Constructs the byte payload to simulate a specific droid's presence"""
+        """Broadcasts a specific droid's presence, formatting its payload only on first use"""
         aff_id = FACTIONS.get(faction_name, 0x01)
         aff_byte = 0x80 + (aff_id * 2)
-        payload = (
-            f"0x{BEACON_PROTOCOL['MFG_ID']:04X} "
-            f"0x{BEACON_TYPE['DROID']:02X} "
-            f"0x{BEACON_PROTOCOL['DATA_LEN']:02X} "
-            f"0x{BEACON_PROTOCOL['DROID_HEADER']:02X} "
-            f"0x{BEACON_PROTOCOL['STATUS_FLAG']:02X} "
-            f"0x{aff_byte:02X} "
-            f"0x{p_id:02X}"
-        )
-        self._send_payload(p_name, payload)
+        key = (p_id, aff_byte)
+        mfg = _DROID_PAYLOAD_CACHE.get(key)
+        if mfg is None:
+            mfg = _DROID_PAYLOAD_CACHE[key] = _build_droid_payload(p_id, aff_byte)
+        self._send_payload(p_name, *mfg)
 
     def stop(self):
         """Stops the advertisement and resets the beacon's internal status"""
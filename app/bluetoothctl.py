@@ -20,6 +20,8 @@ class BluetoothCtl:
         self._cmd_queue = queue.Queue()
         self._queue = queue.Queue(maxsize=500)
         self._stop_event = threading.Event()
+        self._cmd_lock = threading.Lock()
+        self.current_mfg_payload = None
         self._start_process()
         
         # Start a dedicated thread to write to stdin
@@ -88,12 +90,21 @@ class BluetoothCtl:
         """Dedicated thread to prevent the main app from hanging on stdin.write"""
         while not self._stop_event.is_set():
             try:
-                cmd = self._cmd_queue.get(timeout=0.1)
+                cmd, delay, sent = self._cmd_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
                 if self.proc and self.proc.poll() is None:
                     self.proc.stdin.write(cmd + "\n")
                     self.proc.stdin.flush()
-            except (queue.Empty, BrokenPipeError):
-                continue
+            except BrokenPipeError:
+                pass
+            finally:
+                if sent:
+                    sent.set()
+            # Settle time is spent here, never on the caller's thread
+            if delay:
+                time.sleep(delay)
 
     def _reader(self):
         try:
@@ -121,8 +132,13 @@ class BluetoothCtl:
     # ------------------------------------------------------------------
     # Command sending
     # ------------------------------------------------------------------
-    def _send(self, cmd: str, delay: float = 0.0):
-        self._cmd_queue.put(cmd)
+    def _send(self, cmd: str, delay: float = 0.0, sent=None):
+        """Queues a command; the writer sets `sent` once written, then waits `delay` seconds"""
+        self._cmd_queue.put((cmd, delay, sent))
+
+    def _send_batch(self, cmds, delay: float = 0.0):
+        """Queues several commands as one stdin write and flush"""
+        self._cmd_queue.put(("\n".join(cmds), delay, None))
 
     # ------------------------------------------------------------------
     # Public API
@@ -140,42 +156,88 @@ class BluetoothCtl:
         except BluetoothCtlError as e:
             print(f"[BT] Failed to power on: {e}")
 
+    def send_cmd(self, cmd: str, timeout: float = 2.0) -> str:
+        """Run a command on the shared bluetoothctl process and return its output"""
+        with self._cmd_lock:
+            # Drop stale lines so the reply is not mixed with earlier output
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            # Earlier commands may still be queued or settling; start the reply window once ours is on stdin
+            sent = threading.Event()
+            self._send(cmd, sent=sent)
+            if not sent.wait(timeout):
+                return ""
+
+            end = time.monotonic() + timeout
+            output = []
+            while time.monotonic() < end:
+                try:
+                    output.append(self._queue.get(timeout=0.1))
+                except queue.Empty:
+                    # The prompt is not newline-terminated on a pipe, so a quiet gap ends the reply
+                    if output:
+                        break
+            return "".join(output)
+
+    def exclusive(self):
+        """Lock held by command/reply exchanges; hold it while reading output with read_line()"""
+        return self._cmd_lock
+
+    def read_line(self, timeout: float = 0.1):
+        """Returns the next line of bluetoothctl output, or None if none arrived in time. Hold exclusive()."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
     def start_scanning(self):
-        self._send("scan on")
+        # LE-only discovery; droids never advertise over BR/EDR
+        self._send_batch((
+            "menu scan",
+            "transport le",
+            "duplicate-data off",
+            "back",
+            "scan on"
+        ))
 
     def stop_scanning(self):
-        self._send("scan off")
+        self._send("scan off", delay=0.1)
 
     def get_info(self, mac: str, timeout: float = 1.0) -> str:
-        mac = mac.upper()
-        self._send(f"info {mac}", delay=0.0)
-        print(f"[BT] Fetching info for {mac}...")
-    
-        end = time.monotonic() + timeout
-        output = []
-        found_data = False
-    
-        while time.monotonic() < end:
-            try:
-                line = self._queue.get(timeout=0.1)
-                output.append(line)
-                
-                # Specifically look for the end of the data block we need
-                if "ManufacturerData" in line or "ServiceData" in line:
-                    found_data = True
+        with self._cmd_lock:
+            mac = mac.upper()
+            self._send(f"info {mac}", delay=0.0)
+            print(f"[BT] Fetching info for {mac}...")
+        
+            end = time.monotonic() + timeout
+            output = []
+            found_data = False
+        
+            while time.monotonic() < end:
+                try:
+                    line = self._queue.get(timeout=0.1)
+                    output.append(line)
                     
-            except queue.Empty:
-                # If we haven't seen any data yet, keep waiting. 
-                # If we already have some data, give it one last short wait for trailing lines.
-                if found_data:
-                    time.sleep(0.1)
-                    break
-                continue
-                
-        if not found_data:
-            print(f"[BT] Warning: get_info timed out for {mac}")
-    
-        return "".join(output)
+                    # Specifically look for the end of the data block we need
+                    if "ManufacturerData" in line or "ServiceData" in line:
+                        found_data = True
+                        
+                except queue.Empty:
+                    # If we haven't seen any data yet, keep waiting. 
+                    # If we already have some data, give it one last short wait for trailing lines.
+                    if found_data:
+                        time.sleep(0.1)
+                        break
+                    continue
+                    
+            if not found_data:
+                print(f"[BT] Warning: get_info timed out for {mac}")
+        
+            return "".join(output)
 
     # ------------------------------------------------------------------
     # Advertising (stable, no clear abuse)
@@ -186,14 +248,17 @@ class BluetoothCtl:
             return
     
         self._send("advertise off", delay=0.1)
-        self._send("menu advertise")
-        self._send("clear")
-        self._send(f"manufacturer {mfg_id} {mfg_data}")
-        self._send("back")
-        self._send("advertise on")
+        self._send_batch((
+            "menu advertise",
+            "clear",
+            f"manufacturer {mfg_id} {mfg_data}",
+            "back",
+            "advertise on"
+        ))
         self.current_mfg_payload = payload
         print(f"[BT] Updating Advertisement: ID={mfg_id}, Data={mfg_data}")
 
     def stop_advertising(self):
-        self._send("advertise off")
+        # Only give the adapter settle time when something was actually advertising
+        self._send("advertise off", delay=0.1 if self.current_mfg_payload else 0.0)
         self.current_mfg_payload = None
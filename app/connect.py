@@ -14,6 +14,15 @@ import time
 from bleak import BleakClient, BleakScanner
 from dicts import CHARACTERISTICS, COMMANDS, AUDIO_GROUPS
 
+# Action labels built by the toolbox menus: "G<group>C<clip>" and "Script <n>"
+_AUDIO_RE = re.compile(r"^G(\d+)C(\d+)$", re.ASCII)
+_SCRIPT_RE = re.compile(r"\d+", re.ASCII)
+
+# BLE timeouts (seconds): advertisement lookup, link setup, and the quick retry of a cached device
+LOOKUP_TIMEOUT = 5.0
+CONNECT_TIMEOUT = 10.0
+CACHED_CONNECT_TIMEOUT = 2.5
+
 # ----------------------------------------------------------------------
 # Droid Connection (Low Level)
 # ----------------------------------------------------------------------
@@ -23,6 +32,8 @@ class DroidConnection:
         self.loop = None
         self.lock = asyncio.Lock()
         self._cmd_uuid = CHARACTERISTICS["COMMAND"]["uuid"]
+        # BLEDevice per MAC from the last successful lookup, so reconnects skip discovery
+        self._devices = {}
         
     @property
     def is_connected(self):
@@ -42,15 +53,29 @@ class DroidConnection:
                 print(f"[BLE ERROR] Failed to send: {e}")
                 return False
 
-    async def connect(self, mac: str, on_disconnect=None) -> bool:
+    async def connect(self, mac: str, on_disconnect=None, timeout: float = CONNECT_TIMEOUT) -> bool:
+        device = self._devices.get(mac)
+        if device is not None:
+            if await self._connect_device(mac, device, on_disconnect, min(timeout, CACHED_CONNECT_TIMEOUT)):
+                return True
+            # Stale handle or out of range: fall back to a fresh lookup within the same overall budget
+            self._devices.pop(mac, None)
+            timeout = max(timeout - CACHED_CONNECT_TIMEOUT, CACHED_CONNECT_TIMEOUT)
+
         print(f"[BLE] Attempting to find device: {mac}")
-        device = await BleakScanner.find_device_by_address(mac, timeout=5.0)
+        device = await BleakScanner.find_device_by_address(mac, timeout=LOOKUP_TIMEOUT)
         if not device:
             print(f"[BLE] Device {mac} not found in range.")
             return False
 
+        if await self._connect_device(mac, device, on_disconnect, timeout):
+            self._devices[mac] = device
+            return True
+        return False
+
+    async def _connect_device(self, mac, device, on_disconnect, timeout) -> bool:
         # In Bleak 0.19.x, the callback is passed here
-        self.client = BleakClient(device, timeout=10.0, disconnected_callback=on_disconnect)
+        self.client = BleakClient(device, timeout=timeout, disconnected_callback=on_disconnect)
         
         try:
             await self.client.connect()
@@ -102,6 +127,14 @@ class ConnectionManager:
         self.active_mac = None
         self.active_name = None
 
+        # Set by the owner; its motor state is reset from the disconnect callback
+        self.remote_control = None
+
+        # One event loop for the life of the app, started on first connect
+        self._loop = None
+        self._loop_thread = None
+        self._session_stop = None
+
     @property
     def is_connected(self):
         """Check if the droid is currently linked"""
@@ -117,14 +150,25 @@ class ConnectionManager:
         self.active_mac = mac
         self.active_name = name
         
-        threading.Thread(target=self._connect_thread, args=(mac, name), daemon=True).start()
-
-    def _connect_thread(self, mac, name):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        self.conn.loop = loop 
-        
+        loop = self._ensure_loop()
+        asyncio.run_coroutine_threadsafe(self._run_connection(mac, name), loop)
+
+    def _ensure_loop(self):
+        """Starts the persistent BLE event loop thread if it is not running yet"""
+        if self._loop is None or not self._loop_thread.is_alive():
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="BLELoopThread", daemon=True
+            )
+            self._loop_thread.start()
+            self.conn.loop = self._loop
+        return self._loop
+
+    async def _run_connection(self, mac, name):
+        """Owns one connection session on the persistent loop, from connect until stopped"""
         stop_event = asyncio.Event()
+        self._session_stop = stop_event
+        loop = asyncio.get_running_loop()
 
         def handle_disconnect(_):
             print(f"[BLE] {name} disconnected. Resetting remote state.")
@@ -135,32 +179,34 @@ class ConnectionManager:
             
             loop.call_soon_threadsafe(stop_event.set)
 
-        async def run_connection():
-            try:
-                # Pass the handler into our modified connect method
-                success = await asyncio.wait_for(self.conn.connect(mac, on_disconnect=handle_disconnect), timeout=15.0)
-                self.is_connecting = False
-                
-                if not success:
-                    self.last_error = f"Failed to connect to {name}"
-                    stop_event.set()
-                    return
-
-                await stop_event.wait()
+        try:
+            # Pass the handler into our modified connect method
+            success = await asyncio.wait_for(
+                self.conn.connect(mac, on_disconnect=handle_disconnect),
+                timeout=LOOKUP_TIMEOUT + CONNECT_TIMEOUT
+            )
+            self.is_connecting = False
+            
+            if not success:
+                self.last_error = f"Failed to connect to {name}"
+                return
 
-            except Exception as e:
-                self.last_error = f"Connection Error: {str(e)}"
-                stop_event.set()
+            await stop_event.wait()
 
-        try:
-            loop.run_until_complete(run_connection())
+        except Exception as e:
+            self.last_error = f"Connection Error: {str(e)}"
         finally:
             self.is_connecting = False
+            self._session_stop = None
             # Hard stop packets for safety if still physically connected
             if self.conn.client and self.conn.client.is_connected:
-                loop.run_until_complete(self._emergency_stop_packets())
-                loop.run_until_complete(self.conn.disconnect())
-            loop.close()
+                await self._emergency_stop_packets()
+                await self.conn.disconnect()
+
+    async def _emergency_stop_packets(self):
+        """Zeroes the left, right and head motors"""
+        for motor_id in (0, 1, 2):
+            await self.conn._write(bytearray([0x27, 0x00, 0x05, 0x44, motor_id, 0x00, 0x00, 0x00]))
 
     def run_action(self, label, category):
         """Parses UI button labels and categories to trigger corresponding Bluetooth commands"""
@@ -172,13 +218,13 @@ class ConnectionManager:
         if category == "Audio":
             if self.audio_in_progress:
                 return
-            match = re.match(r"G(\d+)C(\d+)", label)
+            match = _AUDIO_RE.match(label)
             if match:
                 g, c = map(int, match.groups())
                 asyncio.run_coroutine_threadsafe(self._play_audio(g, c), self.conn.loop)
         
         elif category == "Scripts":
-            match = re.search(r'\d+', label)
+            match = _SCRIPT_RE.search(label)
             if match:
                 script_id = int(match.group())
                 asyncio.run_coroutine_threadsafe(self.conn.run_script(script_id), self.conn.loop)
@@ -197,15 +243,20 @@ class ConnectionManager:
             self.audio_in_progress = False
 
     def disconnect_droid(self):
-        """Thread-safe request to disconnect the droid and stop the background event loop"""
-        if self.is_connected and self.conn.loop and not self.conn.loop.is_closed():
-            asyncio.run_coroutine_threadsafe(self.conn.disconnect(), self.conn.loop)
-            self.conn.loop.call_soon_threadsafe(self.conn.loop.stop)
+        """Thread-safe request to end the current session; the event loop keeps running"""
+        stop_event = self._session_stop
+        if stop_event and self._loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(stop_event.set)
         
         self.is_connecting = False
         self.active_mac = None
         self.active_name = None
 
+    def _send_packet(self, packet):
+        """Schedules a raw GATT write on the BLE loop without waiting for it"""
+        conn = self.conn
+        asyncio.run_coroutine_threadsafe(conn._write(packet), conn.loop)
+
     def remote_throttle_left(self, speed: float):
         self._send_motor_direct(0, speed) # Motor 0
 
@@ -220,7 +271,7 @@ class ConnectionManager:
         if mag < 0.05:
             # 27 00 05 44 [MotorID] 00 00 00 00
             packet = bytearray([0x27, 0x00, 0x05, 0x44, motor_id, 0x00, 0x00, 0x00])
-            asyncio.run_coroutine_threadsafe(self.conn._write(packet), self.conn.loop)
+            self._send_packet(packet)
             return
 
         # Direction: 0x0 for Fwd, 0x8 for Rev
@@ -232,21 +283,21 @@ class ConnectionManager:
         
         # Format: 27 00 05 44 DM SS RR RR (RRRR = Ramp 0x012C)
         packet = bytearray([0x27, 0x00, 0x05, 0x44, dm_byte, byte_speed, 0x01, 0x2C])
-        asyncio.run_coroutine_threadsafe(self.conn._write(packet), self.conn.loop)
+        self._send_packet(packet)
 
     def bb_drive(self, direction, speed):
         packet = [0x2B, 0x42, 0x0F, 0x48, 0x44, 0x05]
         packet.append(direction)
         packet.append(speed)
         packet.extend([0x01, 0x90, 0x00, 0x00])
-        asyncio.run_coroutine_threadsafe(self.conn._write(packet), self.conn.loop)
+        self._send_packet(packet)
 
     def bb_rotate(self, direction, speed):
         packet = [0x2B, 0x42, 0x0F, 0x48, 0x44, 0x04]
         packet.append(direction)
         packet.append(speed)
         packet.extend([0x00, 0x05, 0x00, 0x00])
-        asyncio.run_coroutine_threadsafe(self.conn._write(packet), self.conn.loop)
+        self._send_packet(packet)
 
     def remote_head(self, value: float):
         if not self.is_connected:
@@ -256,7 +307,7 @@ class ConnectionManager:
         if mag < 0.05:
             # 0x02 is Head Motor ID
             packet = bytearray([0x27, 0x00, 0x05, 0x44, 0x02, 0x00, 0x00, 0x00])
-            asyncio.run_coroutine_threadsafe(self.conn._write(packet), self.conn.loop)
+            self._send_packet(packet)
             return
 
         # Use Command 0x0F Type 2 for Head (smoother R2 rotation)
@@ -269,7 +320,7 @@ class ConnectionManager:
             0x2B, 0x42, 0x0F, 0x48, 0x44, 0x02, 
             direction, byte_speed, 0x00, 0x64, 0x00, 0x01
         ])
-        asyncio.run_coroutine_threadsafe(self.conn._write(packet), self.conn.loop)
+        self._send_packet(packet)
 
     def remote_sound_random(self):
         """Play a random sound clip (Groups 1–7, Clips 1–7)"""
@@ -296,7 +347,7 @@ class ConnectionManager:
         # We send the "Trigger Accessory" signal. 
         # If hardware is present, it moves/sounds. If not, the droid ignores it.
         packet = bytearray([0x27, 0x42, 0x0F, 0x44, 0x44, 0x00, 0x10, 0x08])
-        asyncio.run_coroutine_threadsafe(self.conn._write(packet), self.conn.loop)
+        self._send_packet(packet)
         
     def remote_stop(self):
         if not self.is_connected:
@@ -304,6 +355,6 @@ class ConnectionManager:
 
         # 27 00 05 44 [MotorID] 00 00 00 00
         # Motor IDs: 0 = Left, 1 = Right, 2 = Head
-        for motor_id in [0, 1, 2]:
-            packet = bytearray([0x27, 0x00, 0x05, 0x44, motor_id, 0x00, 0x00, 0x00])
-            asyncio.run_coroutine_threadsafe(self.conn._write(packet), self.conn.loop)
+        send = self._send_packet
+        for motor_id in (0, 1, 2):
+            send(bytearray([0x27, 0x00, 0x05, 0x44, motor_id, 0x00, 0x00, 0x00]))
@@ -63,6 +63,12 @@ class Input:
         self._keys_held_start_time: Dict[str, float] = {}
         self._axis_values: Dict[str, int] = {}
 
+        # Keys that fire this frame, owned by the main thread
+        self._frame_keys: set[str] = set()
+
+        # Set when input changed something the UI should redraw for
+        self._activity = False
+
         # Containers for smoothed values
         self._trigger_smooth: Dict[str, float] = {"L2": 0.0, "R2": 0.0}
         
@@ -107,24 +113,45 @@ class Input:
                 self._keys_held_start_time[key_name] = time.time()
             self._keys_pressed.add(key_name)
             self._keys_held.add(key_name)
+            self._activity = True
 
     def _remove_input_event(self, key_name: str) -> None:
         """Cleans up internal state when a key is released."""
         with self._input_lock:
+            if key_name in self._keys_held:
+                self._activity = True
             self._keys_held.discard(key_name)
             self._keys_held_start_time.pop(key_name, None)
 
+    def begin_frame(self) -> None:
+        """Collects new presses and auto-repeating held keys for this frame in one locked pass."""
+        with self._input_lock:
+            frame_keys = set(self._keys_pressed)
+            self._keys_pressed.clear()
+
+            now = time.time()
+            for key_name, start in self._keys_held_start_time.items():
+                if now - start >= self._initial_delay:
+                    frame_keys.add(key_name)
+            if frame_keys:
+                self._activity = True
+        self._frame_keys = frame_keys
+
     def ui_key(self, key_name: str) -> bool:
         """Used for menu navigation. Supports auto-repeat and consumes press state."""
-        with self._input_lock:
-            is_pressed = key_name in self._keys_pressed
-            self._keys_pressed.discard(key_name)
+        if key_name in self._frame_keys:
+            self._frame_keys.discard(key_name)
+            # The handler is about to change state; have the next frame redraw it
+            self._activity = True
+            return True
+        return False
 
-            if key_name in self._keys_held and key_name in self._keys_held_start_time:
-                held_time = time.time() - self._keys_held_start_time[key_name]
-                if held_time >= self._initial_delay:
-                    is_pressed = True
-            return is_pressed
+    def consume_activity(self) -> bool:
+        """Returns True if input changed since the last call, then resets the flag."""
+        with self._input_lock:
+            activity = self._activity
+            self._activity = False
+            return activity
 
     def ui_handle_navigation(self, selected_position: int, items_per_page: int, total_items: int) -> int:
         """Helper to process standard list navigation."""
@@ -204,9 +231,11 @@ class Input:
         return False
 
     def clear_ui_states(self) -> None:
-        """Flushes the 'pressed' state buffer to prevent accidental double-inputs on menu changes."""
-        with self._input_lock:
-            self._keys_pressed.clear()
+        """Drops this frame's unconsumed keys to prevent accidental double-inputs on menu changes.
+
+        Presses that arrived since begin_frame() are kept for the next frame.
+        """
+        self._frame_keys.clear()
 
     def cleanup(self) -> None:
         """Safely closes all controller handles and shuts down the SDL joystick subsystem."""
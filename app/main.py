@@ -94,7 +94,6 @@ def main() -> None:
         toolbox.start()
 
         while toolbox.running:
-            toolbox.ui.draw_start()
             toolbox.update()
             toolbox.ui.render_to_screen()
             toolbox.input.clear_ui_states()
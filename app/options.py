@@ -4,11 +4,27 @@ options.py - Handles application options and settings.json
 """
 
 import os
+import queue
 import sys
 import threading
+import time
 import json
+from types import MappingProxyType
 from dicts import CONTROLLER_PROFILES
 
+# Seconds the writer waits after a request so a burst of changes becomes one write
+WRITE_COALESCE_DELAY = 0.1
+
+# orjson is optional; fall back to the stdlib encoder when it is not installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 def resource_path(*parts):
     """Return an absolute path to a resource"""
     if hasattr(sys, "_MEIPASS"):
@@ -29,13 +45,23 @@ class OptionsManager:
         self._lock = threading.Lock()
         self.settings_path = settings_path or resource_path("settings.json")
 
-        # Default structure
+        # Default structure. favorites is copy-on-write: writers rebind it, readers never lock
         self.favorites = {}
         self.options_data = {
             "selected_theme": "DEFAULT",
             "controller_profiles": {}
         }
 
+        # Read-only views served to readers without taking the lock
+        self._favorites_view = MappingProxyType({})
+        self._favorites_items = ()
+        self._options_snapshot = MappingProxyType({})
+
+        # Single long-lived writer; _write_settings only queues a request
+        self._write_q = queue.Queue()
+        self._writer = threading.Thread(target=self._io_loop, daemon=True, name="OptionsIOThread")
+        self._writer.start()
+
         self._load_settings()
 
     # ----------------------------
@@ -44,12 +70,18 @@ class OptionsManager:
     def _load_settings(self):
         with self._lock:
             try:
-                if not os.path.exists(self.settings_path) or os.path.getsize(self.settings_path) == 0:
+                # A single open both checks for the file and reads it
+                try:
+                    with open(self.settings_path, "rb") as f:
+                        raw = f.read()
+                except FileNotFoundError:
+                    raw = b""
+
+                if not raw:
                     print("[OPTIONS] No settings file found. Creating a new one.")
                     raise FileNotFoundError()
 
-                with open(self.settings_path, "r") as f:
-                    data = json.load(f)
+                data = json.loads(raw)
 
                 # Validate top-level structure
                 if not isinstance(data, dict):
@@ -59,6 +91,9 @@ class OptionsManager:
                 if not isinstance(self.favorites, dict):
                     print("[OPTIONS] Warning: 'favorites' is not a dict, resetting")
                     self.favorites = {}
+                else:
+                    # Writers always store upper-case MACs; bring hand-edited files in line
+                    self.favorites = {k.upper(): v for k, v in self.favorites.items()}
 
                 self.options_data = data.get("options", {"selected_theme": "ARTOO"})
                 if not isinstance(self.options_data, dict):
@@ -73,16 +108,52 @@ class OptionsManager:
                 if hasattr(self.ui, "show_progress"):
                     self.ui.show_progress("Settings reset due to invalid JSON")
 
+            self._publish_snapshots()
+
+    def _publish_snapshots(self):
+        """Rebinds the reader snapshots. Must be called with the lock held.
+
+        Writers replace favorites and options_data (and any nested dict they change)
+        instead of mutating them, so these read-only views never change underneath a reader.
+        """
+        self._favorites_view = MappingProxyType(self.favorites)
+        self._favorites_items = tuple(self.favorites.items())
+        self._options_snapshot = MappingProxyType(self.options_data)
+
     def _write_settings(self):
-        def _io_task():
-            with self._lock:
-                try:
-                    with open(self.settings_path, "w") as f:
-                        json.dump({"favorites": self.favorites, "options": self.options_data}, f, indent=2)
-                except Exception as e:
-                    print(f"[OPTIONS] IO Error: {e}")
+        self._write_q.put(True)
+
+    def _io_loop(self):
+        """Writer thread: coalesces queued requests and writes settings.json once per burst"""
+        running = True
+        while running:
+            running = self._write_q.get()
+            time.sleep(WRITE_COALESCE_DELAY)
 
-        threading.Thread(target=_io_task, daemon=True, name="OptionsIOThread").start()
+            # Absorb everything queued meanwhile; a None means close() was called
+            try:
+                while True:
+                    if self._write_q.get_nowait() is None:
+                        running = False
+            except queue.Empty:
+                pass
+
+            try:
+                with self._lock:
+                    payload = _dumps({"favorites": self.favorites, "options": self.options_data})
+
+                # Write to a temp file and swap it in so a crash never leaves a torn settings.json
+                tmp_path = self.settings_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.settings_path)
+            except Exception as e:
+                print(f"[OPTIONS] IO Error: {e}")
+
+    def close(self, timeout=1.0):
+        """Flushes any pending write and stops the writer thread"""
+        self._write_q.put(None)
+        self._writer.join(timeout)
 
     # ----------------------------
     # Favorites Management
@@ -90,61 +161,66 @@ class OptionsManager:
     def save_favorite(self, mac, nickname, personality, controller_profile_name="R-Racing"):
         mac = mac.upper()
         with self._lock:
-            self.favorites[mac] = {
+            favorites = dict(self.favorites)
+            favorites[mac] = {
                 "nickname": nickname,
                 "personality": personality,
                 "controller_profile": controller_profile_name
             }
+            self.favorites = favorites
+            self._publish_snapshots()
             self._write_settings()
             print(f"[OPTIONS] Saving favorite: {nickname} ({mac}) | Profile: {controller_profile_name}")
 
     def delete_favorite(self, mac):
         mac = mac.upper()
         with self._lock:
-            self.favorites.pop(mac, None)
-            self.options_data["controller_profiles"].pop(mac, None)
+            favorites = dict(self.favorites)
+            favorites.pop(mac, None)
+            self.favorites = favorites
+            profiles = dict(self.options_data.get("controller_profiles", {}))
+            profiles.pop(mac, None)
+            self.options_data = {**self.options_data, "controller_profiles": profiles}
+            self._publish_snapshots()
             self._write_settings()
 
     def get_favorites_dict(self):
-        """Return the favorites as a dict (MAC → data)."""
-        with self._lock:
-            return self.favorites.copy()
+        """Return the favorites as a dict (MAC → data). Treat as read-only."""
+        return self._favorites_view
 
     def get_favorites_list(self):
-        """Return favorites as a list of (mac, data) tuples for menus."""
-        with self._lock:
-            return list(self.favorites.items())
+        """Return favorites as a tuple of (mac, data) pairs for menus. Rebuilt only on writes."""
+        return self._favorites_items
             
     def has_favorite(self, mac):
         """Check if a droid MAC is in the favorites list."""
-        mac = mac.upper()
-        with self._lock:
-            return mac in self.favorites
+        return mac.upper() in self.favorites
 
     # ----------------------------
     # Controller Profiles
     # ----------------------------
     def get_controller_profile(self, mac):
-        mac = mac.upper()
-        with self._lock:
-            return self.favorites.get(mac, {}).get("controller_profile", "R-Arcade")
+        return self.favorites.get(mac.upper(), {}).get("controller_profile", "R-Arcade")
 
     def set_controller_profile(self, mac, profile):
         mac = mac.upper()
         with self._lock:
             if mac in self.favorites:
-                self.favorites[mac]["controller_profile"] = profile
+                favorites = dict(self.favorites)
+                favorites[mac] = {**favorites[mac], "controller_profile": profile}
+                self.favorites = favorites
+                self._publish_snapshots()
                 self._write_settings()
 
     # ----------------------------
     # Theme Management
     # ----------------------------
     def get_theme(self):
-        with self._lock:
-            return self.options_data.get("selected_theme", "DEFAULT")
+        return self._options_snapshot.get("selected_theme", "DEFAULT")
 
     def set_theme(self, theme_name):
         with self._lock:
-            self.options_data["selected_theme"] = theme_name
+            self.options_data = {**self.options_data, "selected_theme": theme_name}
+            self._publish_snapshots()
             self._write_settings()
         self.ui.apply_theme(theme_name)
@@ -5,12 +5,25 @@ scan.py - Performs the logic in scan actions
 
 import os
 import re
-import subprocess
+import sys
 import time
 import threading
 
 from dicts import FACTIONS, DROIDS
 
+# Reverse lookup for the affiliation byte in a droid advertisement
+_FACTION_BY_ID = {v: k for k, v in FACTIONS.items()}
+
+# Matches "Device <MAC> <name>" lines from `bluetoothctl devices` where the name contains DROID
+# Not anchored, since lines read from the interactive process may carry a prompt prefix
+_DEV_RE = re.compile(r'Device ([0-9A-F:]{17})[^\n]*DROID', re.I)
+
+# Once a droid has been seen, keep listening this long for neighbours before ending the scan early
+SCAN_GRACE_SECONDS = 0.5
+
+# How long a parsed droid identity is trusted before `info` is queried again
+IDENTITY_TTL_SECONDS = 300.0
+
 # ----------------------------------------------------------------------
 # DroidScanner (Low Level)
 # ----------------------------------------------------------------------
@@ -22,6 +35,9 @@ class DroidScanner:
         """Parses hex code to determine the personality and faction of a droid"""
         if not info_text or "ManufacturerData" not in info_text:
             return None
+        # Cheap substring check before the regex work; bluetoothctl prints the value as a spaced hex dump
+        if "03 04" not in info_text and "0304" not in info_text:
+            return None
         try:
             if "ManufacturerData.Value" in info_text:
                 parts = info_text.split("ManufacturerData.Value:")[1]
@@ -40,11 +56,7 @@ class DroidScanner:
                     raw_pers_val = int(payload[10:12], 16)
                     derived_aff_id = (raw_aff_byte - 0x80) // 2
                     
-                    target_f_key = None
-                    for f_key, f_val in FACTIONS.items():
-                        if f_val == derived_aff_id:
-                            target_f_key = f_key
-                            break
+                    target_f_key = _FACTION_BY_ID.get(derived_aff_id)
 
                     if target_f_key:
                         faction_droids = DROIDS.get(target_f_key, {})
@@ -60,51 +72,65 @@ class DroidScanner:
 # Scan Manager (High Level)
 # ----------------------------------------------------------------------
 class ScanManager:
-    def __init__(self, bt_controller, lock=None, favorites=None, progress_callback=None):
+    def __init__(self, bt_controller, get_favorites=None, progress_callback=None):
         self.bt = bt_controller
         self.scanner = DroidScanner(bt_controller)
-        self._lock = lock or threading.Lock()
-        self.favorites = favorites or {}
+        # Called once per scan so results reflect favorites saved since startup
+        self.get_favorites = get_favorites or dict
         self.scanning = False
-        self.scan_results = []
+        # Immutable snapshot, replaced wholesale by the scan thread so readers need no lock
+        self.results = ()
         self.progress_callback = progress_callback
+        # mac -> (monotonic timestamp, identity); filled by scan threads
+        self._identity_cache = {}
+        # Bumped per scan; a thread whose generation is no longer current leaves state alone
+        self._scan_gen = 0
 
     def start_scan(self, duration=3.0):
         """Initiates the background thread to perform a non-blocking device scan"""
         if self.scanning:
             return
+        self._scan_gen += 1
         self.scanning = True
-        threading.Thread(target=self._scan_thread, args=(duration,), daemon=True).start()
+        threading.Thread(target=self._scan_thread, args=(duration, self._scan_gen), daemon=True).start()
 
     def stop_scan(self):
         """Signals the Bluetooth controller to cease discovery and updates state"""
         self.scanning = False
 
-    def _scan_thread(self, duration):
+    def _scan_thread(self, duration, gen):
         try:
             self.bt.power_on()
             
-            # Use the built-in timeout flag of bluetoothctl if available
-            # This allows the process to exit gracefully rather than being killed
-            subprocess.run(["bluetoothctl", "--timeout", str(int(duration)), "scan", "on"], 
-                           capture_output=True, text=True)
+            # Discover on the shared bluetoothctl process instead of spawning one per command
+            self.bt.start_scanning()
+            end = time.monotonic() + duration
+            seen_droid = False
+            # Hold the command lock while reading so no other exchange takes these lines
+            with self.bt.exclusive():
+                while self.scanning and gen == self._scan_gen and time.monotonic() < end:
+                    line = self.bt.read_line(timeout=0.1)
+                    if line and not seen_droid and _DEV_RE.search(line):
+                        # Droid discovered: stop waiting out the full window
+                        seen_droid = True
+                        end = min(end, time.monotonic() + SCAN_GRACE_SECONDS)
+
+                # A newer scan has started; leave the adapter and results to it
+                if gen != self._scan_gen:
+                    return
+                self.bt.stop_scanning()
             
-            raw_devs = subprocess.run(["bluetoothctl", "devices"], 
-                                      capture_output=True, text=True).stdout
-            found_macs = [l.split()[1] for l in raw_devs.splitlines() if "DROID" in l.upper()]
+            raw_devs = self.bt.send_cmd("devices")
+            # Canonical upper-case, interned MACs: every cache and favorites lookup downstream hashes the same string
+            found_macs = list(dict.fromkeys(sys.intern(m.upper()) for m in _DEV_RE.findall(raw_devs)))
             
-            current_favorites = self.favorites or {}
+            current_favorites = self.get_favorites()
             temp_results = []
 
             for mac in found_macs:
-                mac = mac.upper()
-                
-                # Instead of restarting scan on, just get the info
-                # If the data is missing, the previous scan duration was likely too short
-                info_text = subprocess.run(["bluetoothctl", "info", mac], 
-                                           capture_output=True, text=True).stdout
-                
-                identity = self.scanner._parse_personality(info_text)
+                if gen != self._scan_gen:
+                    return
+                identity = self._cached_identity(mac)
                 
                 fav_entry = current_favorites.get(mac)
                 nickname = None
@@ -124,20 +150,37 @@ class ScanManager:
                     "controller_profile": profile
                 })
 
-            with self._lock:
-                self.scan_results = temp_results
+            if gen == self._scan_gen:
+                self.results = tuple(temp_results)
 
         except Exception as e:
             print(f"Scan Error: {e}")
         finally:
-            self.scanning = False
+            # Only the current scan may end the scanning state
+            if gen == self._scan_gen:
+                self.scanning = False
+
+    def _cached_identity(self, mac):
+        """Returns the droid identity for a MAC, querying `info` only when the cache entry is missing or stale"""
+        now = time.monotonic()
+        cached = self._identity_cache.get(mac)
+        if cached and now - cached[0] < IDENTITY_TTL_SECONDS:
+            return cached[1]
+
+        # Instead of restarting scan on, just get the info
+        # If the data is missing, the previous scan duration was likely too short
+        info_text = self.bt.send_cmd(f"info {mac}")
+        identity = self.scanner._parse_personality(info_text)
+
+        # Misses are not cached so the next scan can pick up the advertisement
+        if identity:
+            self._identity_cache[mac] = (now, identity)
+        return identity
 
     def get_results(self):
-        """Provides a thread-safe copy of the currently discovered droid list"""
-        with self._lock:
-            return self.scan_results.copy()
+        """Provides the current immutable snapshot of discovered droids"""
+        return self.results
 
     def clear_results(self):
         """Resets the result list and error tracking for a new scan session"""
-        with self._lock:
-            self.scan_results = []
\ No newline at end of file
+        self.results = ()
\ No newline at end of file
@@ -4,14 +4,16 @@ toolbox.py - Backend logic manager for navigation and actions
 """
 
 import asyncio
+import ctypes
+import functools
 import os
 import random
 import time
 import threading
+from enum import IntEnum
 from typing import List
 
 import sdl2
-import sdl2.ext
 
 # ----------------------------------------------------------------------
 # Local imports
@@ -38,38 +40,180 @@ from dicts import (
     UI_THEMES
 )
 
+# Number of SDL events drained per SDL_PeepEvents call
+EVENT_BATCH = 32
+
+# How long the input thread blocks for an event before re-checking `running` (ms)
+INPUT_WAIT_MS = 100
+
+# ----------------------------------------------------------------------
+# Views
+# ----------------------------------------------------------------------
+class View(IntEnum):
+    MAIN = 0
+    OPTIONS = 1
+    SCAN = 2
+    BEACON = 3
+    CONNECT = 4
+    CONNECTED = 5
+    AUDIO = 6
+    SCRIPT = 7
+    REMOTE = 8
+
+# Menu entry names -> views, resolved once per transition
+_VIEW_BY_NAME = {v.name.lower(): v for v in View}
+
+# Menu row geometry
+ROW_PITCH = 30
+ROW_HEIGHT = 28
+
+# Remote telemetry geometry
+TELEMETRY_RADIUS = 50
+TELEMETRY_SPACING = 160
+TRIGGER_SIZE = (25, 100)
+TRIGGER_GAP = 100
+
+@functools.lru_cache(maxsize=4)
+def telemetry_layout(screen_w: int, screen_h: int, has_triggers: bool):
+    """Returns the left stick, right stick, L2 and R2 positions for the telemetry view"""
+    base_y = screen_h // 2
+
+    if has_triggers:
+        start_x = (screen_w - (TELEMETRY_SPACING + 180)) // 2
+    else:
+        start_x = (screen_w - TELEMETRY_SPACING) // 2
+
+    trigger_x = start_x + TELEMETRY_SPACING + 100
+    trigger_y = base_y - (TRIGGER_SIZE[1] // 2)
+
+    return (
+        (start_x, base_y),
+        (start_x + TELEMETRY_SPACING, base_y),
+        (trigger_x, trigger_y),
+        (trigger_x + TRIGGER_GAP, trigger_y)
+    )
+
+@functools.lru_cache(maxsize=8)
+def row_positions(start_y: int, scroll_limit: int):
+    """Returns the y position of each visible menu row"""
+    return tuple(start_y + i * ROW_PITCH for i in range(scroll_limit))
+
+# ----------------------------------------------------------------------
+# Cached status strings; droid names come from a small, fixed set
+# ----------------------------------------------------------------------
+@functools.lru_cache(maxsize=32)
+def connected_header(name) -> str:
+    return UI_STRINGS["CONNECTED_HEADER"].format(name=name)
+
+@functools.lru_cache(maxsize=32)
+def connecting_msg(name) -> str:
+    return UI_STRINGS["CONN_CONNECTING"].format(name=name)
+
+# ----------------------------------------------------------------------
+# Menu row formatters
+# ----------------------------------------------------------------------
+def _format_item_plain(item) -> str:
+    return str(item)
+
+def _format_item_favorite(item) -> str:
+    """Formats a (mac, data) favorites entry"""
+    mac, data = item
+    display_name = data.get("nickname") or data.get("personality") or "Droid"
+    profile_name = data.get("controller_profile", "R-Arcade")
+    return f"{display_name} :: Profile: {profile_name}"
+
+def _format_item_scan(item) -> str:
+    """Formats a scan result dict"""
+    mac = item.get("mac", "??:??")
+    identity = item.get("identity", "Unknown")
+    personality = item.get("personality", "")
+
+    if personality:
+        return f"[{personality}] {identity} ({mac[-5:]})"
+    return f"{identity} ({mac[-5:]})"
+
 # ----------------------------------------------------------------------
 # DroidToolbox class
 # ----------------------------------------------------------------------
 class DroidToolbox:
+    # Button color references used in UI_BUTTONS
+    _COLOR_KEYS = ("a", "b", "x", "y", "s")
+
+    __slots__ = (
+        "input", "ui", "bt",
+        "options_mgr", "scan_mgr", "beacon_mgr", "conn_mgr", "remote", "active_profile",
+        "_event", "_event_buf",
+        "_renders", "_updates", "_formatters", "_view_formatter",
+        "idx", "main_idx", "beacon_idx", "connect_idx", "connected_idx", "options_idx",
+        "audio_group_idx", "audio_clip_idx", "script_idx",
+        "beacon_selection", "options_selection", "audio_group_selected",
+        "current_view", "submenu", "running",
+        "_main_items", "_main_views", "_connected_items", "_connected_views", "_script_items", "_audio_clip_items",
+        "_audio_group_items", "_beacon_lists",
+        "last_progress_msg", "_progress_deadline", "PROGRESS_STICKY_SECONDS",
+        "_dirty", "_last_render_view", "_last_render_state", "_last_spinner_idx",
+        "_buttons_cache", "_color_map", "_telemetry_labels", "_faction_headers",
+        "_location_by_name", "_droid_by_name",
+        "_options_root_items", "_theme_items", "_profile_items", "_scan_results",
+        "_connect_select_callback", "_selected_favorite_for_profile",
+        "wireframe"
+    )
+
     def __init__(self) -> None:
         self.input = Input()
         self.ui = UserInterface()
         self.bt = BluetoothCtl()
-        self._lock = threading.Lock()
 
         # Managers
         self.options_mgr = OptionsManager(self.ui)
         self.scan_mgr = ScanManager(
-            self.bt, lock=self._lock, favorites=self.options_mgr.get_favorites_dict(), progress_callback=self._show_progress
+            self.bt, get_favorites=self.options_mgr.get_favorites_dict, progress_callback=self._show_progress
         )
         self.beacon_mgr = BeaconManager(self.bt)
         self.conn_mgr = ConnectionManager()
         self.remote = RemoteControl(self.conn_mgr)
+        self.conn_mgr.remote_control = self.remote
         self.active_profile = None
 
-        # Menu Map
-        self.view_map = {
-            "main": (self._render_main, self._update_main),
-            "options": (self._render_options, self._update_options),
-            "scan": (self._render_scan, self._update_scan),
-            "beacon": (self._render_beacon, self._update_beacon),
-            "connect": (self._render_connect, self._update_connect),
-            "connected": (self._render_connected, self._update_connected),
-            "audio": (self._render_audio_menu, self._update_audio_menu),
-            "script": (self._render_script_menu, self._update_script_menu),
-            "remote": (self._render_remote_menu, self._update_remote_menu)
-        }
+        # Reusable event structs: one to block on, a buffer to drain the rest in batches
+        self._event = sdl2.SDL_Event()
+        self._event_buf = (sdl2.SDL_Event * EVENT_BATCH)()
+
+        # Menu Map: render, update and row formatter tuples indexed by View
+        self._renders = (
+            self._render_main,
+            self._render_options,
+            self._render_scan,
+            self._render_beacon,
+            self._render_connect,
+            self._render_connected,
+            self._render_audio_menu,
+            self._render_script_menu,
+            self._render_remote_menu
+        )
+        self._updates = (
+            self._update_main,
+            self._update_options,
+            self._update_scan,
+            self._update_beacon,
+            self._update_connect,
+            self._update_connected,
+            self._update_audio_menu,
+            self._update_script_menu,
+            self._update_remote_menu
+        )
+        self._formatters = (
+            _format_item_plain,
+            _format_item_plain,
+            _format_item_scan,
+            _format_item_plain,
+            _format_item_favorite,
+            _format_item_plain,
+            _format_item_plain,
+            _format_item_plain,
+            _format_item_plain
+        )
+        self._view_formatter = _format_item_plain
 
         # Indexes
         self.idx = 0
@@ -85,78 +229,161 @@ class DroidToolbox:
         self.beacon_selection = []
         self.options_selection = []
         self.audio_group_selected = None
-        self.current_view = "main"
+        self._selected_favorite_for_profile = None
+        self.current_view = View.MAIN
         self.submenu = None
         self.running = True
 
+        # Static menu items, built once instead of every frame
+        self._main_items = (
+            UI_STRINGS["MAIN_SCAN"],
+            UI_STRINGS["MAIN_BEACON"],
+            UI_STRINGS["MAIN_CONNECT"],
+            UI_STRINGS["MAIN_OPTIONS"],
+            UI_STRINGS["MAIN_EXIT"]
+        )
+        self._main_views = ("scan", "beacon", "connect", "options", "exit")
+        self._connected_items = (
+            UI_STRINGS["CONNECTED_PLAY_AUDIO"],
+            UI_STRINGS["CONNECTED_RUN_SCRIPT"],
+            UI_STRINGS["CONNECTED_REMOTE_CONTROL"],
+            UI_STRINGS["CONNECTED_DISCONNECT"]
+        )
+        # Submenu per connected entry; None disconnects
+        self._connected_views = (View.AUDIO, View.SCRIPT, View.REMOTE, None)
+        self._script_items = tuple(f"Script {i + 1}" for i in range(18))
+        self._audio_clip_items = tuple(f"Clip {i + 1}" for i in range(8))
+        self._audio_group_items = tuple(f"G{k}: {v}" for k, v in AUDIO_GROUPS.items())
+
+        # Beacon menu items keyed by tuple(beacon_selection)
+        self._beacon_lists = {
+            (): ("Location Beacons", *FACTIONS.keys()),
+            ("Location Beacons",): tuple(v[1] for v in LOCATIONS.values()),
+            **{(f,): tuple(d["name"] for d in DROIDS[f].values()) for f in FACTIONS}
+        }
+
+        # Static options menu lists
+        self._options_root_items = (UI_STRINGS["OPTIONS_THEME"], UI_STRINGS["OPTIONS_MAPPINGS"])
+        self._theme_items = tuple(UI_THEMES.keys())
+        self._profile_items = tuple(CONTROLLER_PROFILES.keys())
+
+        self._scan_results = ()
+        self._connect_select_callback = None
+
         self.last_progress_msg = None
-        self.last_progress_time = 0.0
+        self._progress_deadline = 0.0
         self.PROGRESS_STICKY_SECONDS = 2.0
 
+        # Redraw tracking: render only when something visible changed
+        self._dirty = True
+        self._last_render_view = None
+        self._last_render_state = None
+        self._last_spinner_idx = -1
+
+        # Button bar configs keyed by the tuple of button keys
+        self._buttons_cache = {}
+
+        # Telemetry labels keyed by controller profile
+        self._telemetry_labels = {}
+
+        # Beacon droid headers keyed by faction
+        self._faction_headers = {
+            f: UI_STRINGS["BEACON_HEADER_DROIDS"].format(faction=f.upper()) for f in FACTIONS
+        }
+
+        # Beacon name -> id lookups for confirming a selection
+        self._location_by_name = {v[1]: k for k, v in LOCATIONS.items()}
+        self._droid_by_name = {f: {d["name"]: i for i, d in DROIDS[f].items()} for f in DROIDS}
+
         # Apply theme
         self.wireframe = f"droid{random.randint(1, 3)}_wireframe"
         current_theme = self.options_mgr.get_theme()
-        self.ui.apply_theme(current_theme)
+        self._apply_theme(current_theme)
 
     # ----------------------------------------------------------------------
     # Helpers
     # ----------------------------------------------------------------------
+    def _apply_theme(self, theme_name):
+        """Applies a UI theme and refreshes everything derived from its colors"""
+        self.ui.apply_theme(theme_name)
+        self._color_map = {k: getattr(self.ui, f"c_btn_{k}") for k in self._COLOR_KEYS}
+        self._buttons_cache.clear()
+
     def _set_buttons(self, *btn_keys):
-        self.ui.buttons_config = []
-        
-        color_map = {
-            "a": self.ui.c_btn_a,
-            "b": self.ui.c_btn_b,
-            "x": self.ui.c_btn_x,
-            "y": self.ui.c_btn_y,
-            "s": self.ui.c_btn_s
-        }
+        cfg = self._buttons_cache.get(btn_keys)
+        if cfg is None:
+            cfg = self._build_buttons(btn_keys)
+            self._buttons_cache[btn_keys] = cfg
+        self.ui.buttons_config = cfg
+
+    def _build_buttons(self, btn_keys):
+        buttons = []
+        color_map = self._color_map
 
         for key in btn_keys:
             cfg = UI_BUTTONS.get(key)
             if cfg:
-                self.ui.buttons_config.append({
+                buttons.append({
                     "key": cfg["btn"],
                     "label": cfg["label"],
                     "color": color_map.get(cfg["color_ref"], self.ui.c_text)
                 })
+        return buttons
 
     def _reset_bluetooth_adapter(self):
         if self.conn_mgr.is_connecting or self.conn_mgr.is_connected:
                     return
         self.scan_mgr.stop_scan()
         self.beacon_mgr.stop()
-        time.sleep(0.3)
 
     def _monitor_input(self) -> None:
+        ev_ref = ctypes.byref(self._event)
+        buf = self._event_buf
+        check_event = self.input.check_event
         while self.running:
             try:
-                for ev in sdl2.ext.get_events():
-                    self.input.check_event(ev)
-                    if ev.type == sdl2.SDL_QUIT:
-                        continue
+                # Block until an event arrives, then drain everything queued in fixed-size batches
+                if not sdl2.SDL_WaitEventTimeout(ev_ref, INPUT_WAIT_MS):
+                    continue
+                if self._event.type != sdl2.SDL_QUIT:
+                    check_event(self._event)
+                while True:
+                    n = sdl2.SDL_PeepEvents(buf, EVENT_BATCH, sdl2.SDL_GETEVENT,
+                                            sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT)
+                    for i in range(n):
+                        ev = buf[i]
+                        if ev.type == sdl2.SDL_QUIT:
+                            continue
+                        check_event(ev)
+                    if n < EVENT_BATCH:
+                        break
             except Exception as e:
                 print(f"[INPUT THREAD ERROR] {e}")
                 self.running = False
-            time.sleep(0.001)
 
-    def _change_view(self, target: str):
+    def _change_view(self, name: str):
         self._reset_bluetooth_adapter()
+        self._dirty = True
+
+        if name == "exit":
+            self.running = False
+            return
+
+        target = _VIEW_BY_NAME[name]
         self.current_view = target
         self.submenu = None
         self.idx = 0
         
-        if target == "scan":
+        if target == View.SCAN:
             self.scan_mgr.start_scan()
-        elif target == "beacon":
+        elif target == View.BEACON:
             self.beacon_selection = []
             self.beacon_idx = 0
-        elif target == "exit":
-            self.running = False
 
     def _reset_to_main(self, show_msg: str = None):
         self._reset_bluetooth_adapter()
-        self.current_view = "main"
+        self._dirty = True
+        self.current_view = View.MAIN
         self.submenu = None
         self.idx = 0
         self.main_idx = 0
@@ -170,66 +397,82 @@ class DroidToolbox:
 
     def _show_progress(self, msg: str):
         self.last_progress_msg = msg
-        self.last_progress_time = time.time()
-
-    def _render_menu_list(self, items: list, current_idx: int, start_y: int = 60, scroll_limit: int = 12):
+        self._progress_deadline = time.monotonic() + self.PROGRESS_STICKY_SECONDS
+        self._dirty = True
+
+    def _needs_render(self, target) -> bool:
+        """Decides whether the active view has to be redrawn this frame"""
+        if self.input.consume_activity():
+            self._dirty = True
+
+        # Background state that is shown on screen
+        state = (
+            self.conn_mgr.is_connected,
+            self.conn_mgr.is_connecting,
+            self.scan_mgr.scanning,
+            self.beacon_mgr.current_active
+        )
+        if state != self._last_render_state:
+            self._last_render_state = state
+            self._dirty = True
+
+        if self.scan_mgr.scanning or self.conn_mgr.is_connecting:
+            spinner_idx = self.ui.spinner_index()
+            if spinner_idx != self._last_spinner_idx:
+                self._last_spinner_idx = spinner_idx
+                self._dirty = True
+
+        # Sticky progress message just expired
+        if self.last_progress_msg and time.monotonic() >= self._progress_deadline:
+            self.last_progress_msg = None
+            self._dirty = True
+
+        # Remote telemetry and scrolling rows animate every frame
+        return self._dirty or self.ui.animating or target == View.REMOTE or target != self._last_render_view
+
+    def _render_menu_list(self, items: list, current_idx: int, start_y: int = 60, scroll_limit: int = 12,
+                          formatter=None):
         if not items:
             return 0
 
+        if formatter is None:
+            formatter = self._view_formatter
+
         current_idx = max(0, min(current_idx, len(items) - 1))
         start_view = max(0, current_idx - (scroll_limit - 1))
+        end_view = min(start_view + scroll_limit, len(items))
 
-        for i, item in enumerate(items[start_view:start_view + scroll_limit]):
-            actual_idx = start_view + i
-            sel = (actual_idx == current_idx)
-            y_pos = start_y + i * 30
+        ui = self.ui
+        row_list = ui.row_list
+        row_w = ui.screen_width // 2
 
-            if isinstance(item, tuple):
-                mac, data = item
-                display_name = data.get("nickname") or data.get("personality") or "Droid"
-                profile_name = data.get("controller_profile", "R-Arcade")
-                label = f"{display_name} :: Profile: {profile_name}"
-            
-            elif isinstance(item, dict):
-                mac = item.get("mac", "??:??")
-                identity = item.get("identity", "Unknown")
-                personality = item.get("personality", "")
-                
-                if personality:
-                    label = f"[{personality}] {identity} ({mac[-5:]})"
-                else:
-                    label = f"{identity} ({mac[-5:]})"
-            
-            else:
-                label = str(item)
+        for actual_idx, y_pos in zip(range(start_view, end_view), row_positions(start_y, scroll_limit)):
+            sel = (actual_idx == current_idx)
 
-            self.ui.row_list(
-                label,
+            row_list(
+                formatter(items[actual_idx]),
                 (20, y_pos),
-                self.ui.screen_width // 2,
-                28,
+                row_w,
+                ROW_HEIGHT,
                 sel,
-                color=self.ui.c_text if sel else self.ui.c_header_bg
+                color=ui.c_text if sel else ui.c_header_bg
             )
 
-        if self.current_view == "main" and self.submenu is None:
+        if self.current_view == View.MAIN and self.submenu is None:
             self.ui.draw_image(self.wireframe)
 
         return start_view
         
     def _get_active_status(self, default_msg: str) -> str:
         if self.last_progress_msg:
-            elapsed = time.time() - self.last_progress_time
-            if elapsed < self.PROGRESS_STICKY_SECONDS:
+            if time.monotonic() < self._progress_deadline:
                 if self.conn_mgr.is_connecting:
-                    self.ui.spin()
                     return f"{self.last_progress_msg} {self.ui.spinner_frame}"
                 return self.last_progress_msg
             else:
                 self.last_progress_msg = None
 
         if self.scan_mgr.scanning:
-            self.ui.spin()
             return f"{default_msg} {self.ui.spinner_frame}"
 
         return default_msg
@@ -241,67 +484,68 @@ class DroidToolbox:
         self.ui.draw_header(UI_STRINGS["MAIN_HEADER"])
         status = self._get_active_status(UI_STRINGS["MAIN_FOOTER"])
         self.ui.draw_status_footer(status)
-        menu_items = [UI_STRINGS["MAIN_SCAN"], UI_STRINGS["MAIN_BEACON"], UI_STRINGS["MAIN_CONNECT"], UI_STRINGS["MAIN_OPTIONS"], UI_STRINGS["MAIN_EXIT"]]
-        
-        self._render_menu_list(menu_items, self.main_idx)
+        self._render_menu_list(self._main_items, self.main_idx)
 
         self._set_buttons("SELECT", "EXIT")
         self.ui.draw_buttons()
 
     def _update_main(self):
-        menu_items = [UI_STRINGS["MAIN_SCAN"], UI_STRINGS["MAIN_BEACON"], 
-                          UI_STRINGS["MAIN_CONNECT"], UI_STRINGS["MAIN_OPTIONS"], UI_STRINGS["MAIN_EXIT"]]
-            
-        self.main_idx = self.input.ui_handle_navigation(self.main_idx, 1, len(menu_items))
+        ui_key = self.input.ui_key
+        nav = self.input.ui_handle_navigation
+
+        self.main_idx = nav(self.main_idx, 1, len(self._main_items))
 
-        if self.input.ui_key("A"):
-            views = ["scan", "beacon", "connect", "options", "exit"]
-            self._change_view(views[self.main_idx])
-        elif self.input.ui_key("B"):
+        if ui_key("A"):
+            self._change_view(self._main_views[self.main_idx])
+        elif ui_key("B"):
             self.running = False
 
     # ----------------------------------------------------------------------
     # Options Menu
     # ----------------------------------------------------------------------
+    def _current_options_items(self):
+        """Returns the (items, row formatter) for the current options submenu"""
+        if not self.options_selection:
+            return self._options_root_items, _format_item_plain
+
+        category = self.options_selection[0]
+        if category == UI_STRINGS["OPTIONS_THEME"]:
+            return self._theme_items, _format_item_plain
+        if category == UI_STRINGS["OPTIONS_MAPPINGS"]:
+            if self._selected_favorite_for_profile is None:
+                return self.options_mgr.get_favorites_list(), _format_item_favorite
+            return self._profile_items, _format_item_plain
+        return (), _format_item_plain
+
     def _render_options(self):
-        category = None
+        items, formatter = self._current_options_items()
         if not self.options_selection:
             header = UI_STRINGS["OPTIONS_HEADER"]
-            items = [
-                UI_STRINGS["OPTIONS_THEME"],
-                UI_STRINGS["OPTIONS_MAPPINGS"]
-            ]
         else:
-            category = self.options_selection[0]
-            header = f"--- {category.upper()} ---"
-
-            if category == UI_STRINGS["OPTIONS_THEME"]:
-                items = list(UI_THEMES.keys())
-            elif category == UI_STRINGS["OPTIONS_MAPPINGS"]:
-                if not hasattr(self, "_selected_favorite_for_profile") or self._selected_favorite_for_profile is None:
-                    items = self.options_mgr.get_favorites_list() or []
-                else:
-                    items = list(CONTROLLER_PROFILES.keys())
+            header = f"--- {self.options_selection[0].upper()} ---"
 
         self.ui.draw_header(header)
         status = self._get_active_status(UI_STRINGS["MAIN_FOOTER"])
         self.ui.draw_status_footer(status)
         
-        self._render_menu_list(items, self.options_idx)
+        self._render_menu_list(items, self.options_idx, formatter=formatter)
         self._set_buttons("SELECT", "BACK")
         self.ui.draw_buttons()
-        self._options_items_cache = items
 
     def _update_options(self):
-        items = getattr(self, "_options_items_cache", [])
+        ui_key = self.input.ui_key
+        nav = self.input.ui_handle_navigation
+        show = self._show_progress
+
+        items, _ = self._current_options_items()
         if not items:
             return
 
         category = self.options_selection[0] if self.options_selection else None
-        self.options_idx = self.input.ui_handle_navigation(self.options_idx, 1, len(items))
+        self.options_idx = nav(self.options_idx, 1, len(items))
 
         # Selection / actions
-        if self.input.ui_key("A"):
+        if ui_key("A"):
             selected = items[self.options_idx]
             if not self.options_selection:
                 # Enter submenu
@@ -312,10 +556,10 @@ class DroidToolbox:
 
                 if category == UI_STRINGS["OPTIONS_THEME"]:
                     self.options_mgr.set_theme(selected)
-                    self.ui.apply_theme(selected)
+                    self._apply_theme(selected)
 
                 elif category == UI_STRINGS["OPTIONS_MAPPINGS"]:
-                    if not hasattr(self, "_selected_favorite_for_profile") or self._selected_favorite_for_profile is None:
+                    if self._selected_favorite_for_profile is None:
                         # Pick favorite
                         if isinstance(selected, tuple):
                             mac, _ = selected
@@ -326,27 +570,26 @@ class DroidToolbox:
                         profile_name = selected
                         mac = self._selected_favorite_for_profile
                         self.options_mgr.set_controller_profile(mac, profile_name)
-                        self._show_progress(f"Profile '{profile_name}' assigned to favorite")
+                        show(f"Profile '{profile_name}' assigned to favorite")
                         # Reset back to pick favorite
                         self._selected_favorite_for_profile = None
                         self.options_idx = 0
 
         # Delete favorite
-        elif self.input.ui_key("X"):
+        elif ui_key("X"):
             if self.options_selection and self.options_selection[0] == UI_STRINGS["OPTIONS_FAVORITES"]:
                 selected = items[self.options_idx]
                 if isinstance(selected, tuple):
                     mac, data = selected
                     self.options_mgr.delete_favorite(mac)
-                    self._show_progress(UI_STRINGS["FAVORITES_DELCONF"])
+                    show(UI_STRINGS["FAVORITES_DELCONF"])
                     # Update items and clamp index
-                    items = self.options_mgr.get_favorites_list() or []
-                    self._options_items_cache = items
+                    items = self.options_mgr.get_favorites_list()
                     self.options_idx = max(0, min(self.options_idx, len(items) - 1))
 
         # Back
-        elif self.input.ui_key("B"):
-            if category == UI_STRINGS["OPTIONS_MAPPINGS"] and getattr(self, "_selected_favorite_for_profile", None):
+        elif ui_key("B"):
+            if category == UI_STRINGS["OPTIONS_MAPPINGS"] and self._selected_favorite_for_profile:
                 # Go back to favorite selection
                 self._selected_favorite_for_profile = None
                 self.options_idx = 0
@@ -361,10 +604,9 @@ class DroidToolbox:
     # ----------------------------------------------------------------------
     def _render_scan(self):
         self.ui.draw_header(UI_STRINGS["SCAN_HEADER"])
-        items = self.scan_mgr.get_results()
+        items = self._scan_results
 
         if self.scan_mgr.scanning:
-            self.ui.spin()
             status_msg = UI_STRINGS['SCAN_MSG']
         else:
             status_msg = UI_STRINGS["SCAN_PROMPT"] if items else UI_STRINGS["SCAN_NONE"]
@@ -381,55 +623,52 @@ class DroidToolbox:
         self.ui.draw_buttons()
 
     def _update_scan(self):
-        items = self.scan_mgr.get_results()
+        ui_key = self.input.ui_key
+        nav = self.input.ui_handle_navigation
+        show = self._show_progress
+
+        items = self._scan_results
         selected = items[self.idx] if items else None
 
         if selected:
-            self.idx = self.input.ui_handle_navigation(self.idx, 1, len(items))
+            self.idx = nav(self.idx, 1, len(items))
             mac = selected["mac"]
             nickname = selected.get("nickname") or selected.get("identity") or "Droid"
             personality = selected.get("personality", "Default")
             controller_profile = selected.get("controller_profile")
 
-            if self.input.ui_key("Y"):
+            if ui_key("Y"):
                 if self.options_mgr.has_favorite(mac):
                     self.options_mgr.delete_favorite(mac)
-                    self._show_progress(UI_STRINGS["FAVORITES_DELCONF"])
+                    show(UI_STRINGS["FAVORITES_DELCONF"])
                 else:
                     self.options_mgr.save_favorite(mac, nickname, personality, controller_profile)
-                    self._show_progress(UI_STRINGS["FAVORITES_SAVED"])
-
-        elif self.input.ui_key("A"):
-            name = data.get("nickname", "Droid")
-            self._show_progress(UI_STRINGS["CONN_CONNECTING"].format(name=name))
-            # Launch connection in background to prevent UI stutter
-            threading.Thread(
-                target=self.conn_mgr.connect_droid, 
-                args=(mac, name), 
-                daemon=True
-            ).start()
-
-        if self.input.ui_key("X"):
+                    show(UI_STRINGS["FAVORITES_SAVED"])
+
+            elif ui_key("A"):
+                self._connect_to(mac, nickname)
+
+        if ui_key("X"):
             self.scan_mgr.start_scan()
-            self._show_progress(UI_STRINGS["SCAN_MSG"])
+            show(UI_STRINGS["SCAN_MSG"])
 
-        elif self.input.ui_key("B"):
+        elif ui_key("B"):
             self._reset_to_main()
 
     # ----------------------------------------------------------------------
     # Beacon Menu
     # ----------------------------------------------------------------------
+    def _current_beacon_items(self):
+        return self._beacon_lists[tuple(self.beacon_selection)]
+
     def _render_beacon(self):
+        items = self._current_beacon_items()
         if not self.beacon_selection:
-            items = ["Location Beacons"] + list(FACTIONS.keys())
             header = UI_STRINGS["BEACON_HEADER_MAIN"]
         elif self.beacon_selection[0] == "Location Beacons":
-            items = [v[1] for v in LOCATIONS.values()]
             header = UI_STRINGS["BEACON_HEADER_LOCATIONS"]
         else:
-            faction = self.beacon_selection[0]
-            items = [d["name"] for d in DROIDS[faction].values()]
-            header = UI_STRINGS["BEACON_HEADER_DROIDS"].format(faction=faction.upper())
+            header = self._faction_headers[self.beacon_selection[0]]
 
         self.ui.draw_header(header)
         
@@ -440,10 +679,13 @@ class DroidToolbox:
         self._render_menu_list(items, self.beacon_idx)
         self._set_buttons("SELECT", "BACK", "STOP")
         self.ui.draw_buttons()
-        self._beacon_items_cache = items
 
     def _update_beacon(self):
-        if self.input.ui_key("B"):
+        ui_key = self.input.ui_key
+        nav = self.input.ui_handle_navigation
+        show = self._show_progress
+
+        if ui_key("B"):
             if self.beacon_selection:
                 self.beacon_selection.pop()
                 self.beacon_idx = 0
@@ -451,15 +693,15 @@ class DroidToolbox:
                 self._reset_to_main()
             return
 
-        if self.input.ui_key("X"):
+        if ui_key("X"):
             self.beacon_mgr.stop()
-            self._show_progress("Beacon Stopped")
+            show("Beacon Stopped")
             return
 
-        items = getattr(self, "_beacon_items_cache", [])
-        self.beacon_idx = self.input.ui_handle_navigation(self.beacon_idx, 1, len(items))
+        items = self._current_beacon_items()
+        self.beacon_idx = nav(self.beacon_idx, 1, len(items))
 
-        if self.input.ui_key("A") and items:
+        if ui_key("A") and items:
             selected = items[self.beacon_idx]
             if not self.beacon_selection:
                 self.beacon_selection.append(selected)
@@ -469,14 +711,12 @@ class DroidToolbox:
                 self._start_beacon(selected)
 
     def _start_beacon(self, selected_name):
-        time.sleep(0.1)
-
         if self.beacon_selection[0] == "Location Beacons":
-            loc_id = next(k for k, v in LOCATIONS.items() if v[1] == selected_name)
+            loc_id = self._location_by_name[selected_name]
             self.beacon_mgr.start_location(loc_id, selected_name)
         else:
             faction = self.beacon_selection[0]
-            droid_id = next(i for i, d in DROIDS[faction].items() if d["name"] == selected_name)
+            droid_id = self._droid_by_name[faction][selected_name]
             self.beacon_mgr.start_droid(faction, droid_id, selected_name)
 
     # ----------------------------------------------------------------------
@@ -508,14 +748,17 @@ class DroidToolbox:
         # Buttons
         self._set_buttons("SELECT", "DELETE", "BACK")
         self.ui.draw_buttons()
-        self._connect_items_cache = fav_items
         self._connect_select_callback = on_select
 
     def _update_connect(self):
-        fav_items = getattr(self, "_connect_items_cache", [])
+        ui_key = self.input.ui_key
+        nav = self.input.ui_handle_navigation
+        show = self._show_progress
+
+        fav_items = self.options_mgr.get_favorites_list()
 
         # Always allow backing out
-        if self.input.ui_key("B"):
+        if ui_key("B"):
             self._reset_to_main()
             return
 
@@ -524,76 +767,67 @@ class DroidToolbox:
             return
 
         # Navigation
-        self.connect_idx = self.input.ui_handle_navigation(self.connect_idx, 1, len(fav_items))
+        self.connect_idx = nav(self.connect_idx, 1, len(fav_items))
         mac, data = fav_items[self.connect_idx]
 
         # Delete favorite
-        if self.input.ui_key("X"):
+        if ui_key("X"):
             self.options_mgr.delete_favorite(mac)
             self.connect_idx = max(0, self.connect_idx - 1)
-            self._show_progress(UI_STRINGS["FAVORITES_DELCONF"])
+            show(UI_STRINGS["FAVORITES_DELCONF"])
             return
 
         # Select favorite
-        if self.input.ui_key("A"):
-            name = data.get("nickname", "Droid")
-            self._show_progress(UI_STRINGS["CONN_CONNECTING"].format(name=name))
-            threading.Thread(
-                target=self.conn_mgr.connect_droid,
-                args=(mac, name),
-                daemon=True
-            ).start()
+        if ui_key("A"):
+            self._connect_to(mac, data.get("nickname", "Droid"))
+
+    def _connect_to(self, mac, name):
+        """Shows the connecting status and starts a background connection"""
+        self._show_progress(connecting_msg(name))
+        # connect_droid only schedules work on the BLE loop, so the UI never waits on it
+        self.conn_mgr.connect_droid(mac, name)
 
     # ----------------------------------------------------------------------
     # Connected Menu (Connected to Droid)
     # ----------------------------------------------------------------------
     def _render_connected(self):
-        self.ui.draw_header(UI_STRINGS["CONNECTED_HEADER"].format(name=self.conn_mgr.active_name))
-        options = [
-            UI_STRINGS["CONNECTED_PLAY_AUDIO"],
-            UI_STRINGS["CONNECTED_RUN_SCRIPT"],
-            UI_STRINGS["CONNECTED_REMOTE_CONTROL"],
-            UI_STRINGS["CONNECTED_DISCONNECT"]
-        ]
-        self._render_menu_list(options, self.connected_idx)
+        self.ui.draw_header(connected_header(self.conn_mgr.active_name))
+        self._render_menu_list(self._connected_items, self.connected_idx)
         
         self._set_buttons("SELECT", "BACK")
         self.ui.draw_buttons()
         self.ui.draw_status_footer(UI_STRINGS["CONNECTED_FOOTER"])
 
     def _update_connected(self):
-        self.connected_idx = self.input.ui_handle_navigation(self.connected_idx, 1, 4)
+        ui_key = self.input.ui_key
+        nav = self.input.ui_handle_navigation
+
+        self.connected_idx = nav(self.connected_idx, 1, len(self._connected_items))
         
-        if self.input.ui_key("B"):
+        if ui_key("B"):
             self._handle_disconnect()
 
-        elif self.input.ui_key("A"):
-            choices = ["audio", "script", "remote", "disconnect"]
-            choice = choices[self.connected_idx]
+        elif ui_key("A"):
+            view = self._connected_views[self.connected_idx]
 
-            if choice == "disconnect":
+            if view is None:
                 self._handle_disconnect()
             else:
-                self.submenu = choice
+                self.submenu = view
 
     def _handle_disconnect(self):
         print(f"[CONN] Initiating disconnect from: {self.conn_mgr.active_name}")
         self.conn_mgr.is_connecting = False
         
         if self.conn_mgr.is_connected and self.conn_mgr.conn:
-            def perform_disconnect():
-                try:
-                    loop = self.conn_mgr.conn.loop
-                    if loop and loop.is_running():
-                        future = asyncio.run_coroutine_threadsafe(
-                            self.conn_mgr.conn.disconnect(), 
-                            loop
-                        )
-                        future.result(timeout=2.0)
-                except Exception as e:
-                    print(f"Disconnect error: {e}")
-
-            threading.Thread(target=perform_disconnect, daemon=True).start()
+            def log_result(future):
+                if not future.cancelled() and future.exception():
+                    print(f"Disconnect error: {future.exception()}")
+
+            loop = self.conn_mgr.conn.loop
+            if loop and loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(self.conn_mgr.conn.disconnect(), loop)
+                future.add_done_callback(log_result)
 
         self.conn_mgr.active_mac = None
         self.conn_mgr.active_name = None
@@ -606,11 +840,11 @@ class DroidToolbox:
         self.ui.draw_header(UI_STRINGS["AUDIO_HEADER"])
         
         if self.audio_group_selected is None:
-            items = [f"G{k}: {v}" for k, v in AUDIO_GROUPS.items()]
+            items = self._audio_group_items
             idx = self.audio_group_idx
             self.ui.draw_status_footer(UI_STRINGS["AUDIO_FOOTER1"])
         else:
-            items = [f"Clip {i + 1}" for i in range(8)]
+            items = self._audio_clip_items
             idx = self.audio_clip_idx
             self.ui.draw_status_footer(UI_STRINGS["AUDIO_FOOTER2"])
 
@@ -619,14 +853,17 @@ class DroidToolbox:
         self.ui.draw_buttons()
 
     def _update_audio_menu(self):
+        ui_key = self.input.ui_key
+        nav = self.input.ui_handle_navigation
+
         if self.audio_group_selected is None:
-            self.audio_group_idx = self.input.ui_handle_navigation(self.audio_group_idx, 1, len(AUDIO_GROUPS))
-            if self.input.ui_key("B"): self.submenu = None
-            elif self.input.ui_key("A"): self.audio_group_selected = self.audio_group_idx
+            self.audio_group_idx = nav(self.audio_group_idx, 1, len(self._audio_group_items))
+            if ui_key("B"): self.submenu = None
+            elif ui_key("A"): self.audio_group_selected = self.audio_group_idx
         else:
-            self.audio_clip_idx = self.input.ui_handle_navigation(self.audio_clip_idx, 1, 8)
-            if self.input.ui_key("B"): self.audio_group_selected = None
-            elif self.input.ui_key("A"):
+            self.audio_clip_idx = nav(self.audio_clip_idx, 1, len(self._audio_clip_items))
+            if ui_key("B"): self.audio_group_selected = None
+            elif ui_key("A"):
                 self.conn_mgr.run_action(f"G{self.audio_group_selected}C{self.audio_clip_idx}", "Audio")
 
     # ----------------------------------------------------------------------
@@ -634,17 +871,18 @@ class DroidToolbox:
     # ----------------------------------------------------------------------
     def _render_script_menu(self):
         self.ui.draw_header(UI_STRINGS["SCRIPTS_HEADER"])
-        items = [f"Script {i + 1}" for i in range(18)]
-        
-        self._render_menu_list(items, self.script_idx)
+        self._render_menu_list(self._script_items, self.script_idx)
         self.ui.draw_status_footer(UI_STRINGS["SCRIPTS_FOOTER"])
         self._set_buttons("SELECT", "BACK")
         self.ui.draw_buttons()
 
     def _update_script_menu(self):
-        self.script_idx = self.input.ui_handle_navigation(self.script_idx, 1, 18)
-        if self.input.ui_key("B"): self.submenu = None
-        elif self.input.ui_key("A"):
+        ui_key = self.input.ui_key
+        nav = self.input.ui_handle_navigation
+
+        self.script_idx = nav(self.script_idx, 1, len(self._script_items))
+        if ui_key("B"): self.submenu = None
+        elif ui_key("A"):
             self.conn_mgr.run_action(f"Script {self.script_idx + 1}", "Scripts")
 
     # ----------------------------------------------------------------------
@@ -659,7 +897,9 @@ class DroidToolbox:
         self.ui.draw_buttons()
 
     def _update_remote_menu(self):
-        if self.input.ui_key("B"):
+        ui_key = self.input.ui_key
+
+        if ui_key("B"):
             threading.Thread(target=self.conn_mgr.remote_stop, daemon=True).start()
             self.submenu = None
             return
@@ -674,69 +914,54 @@ class DroidToolbox:
             print(f"CRITICAL: Remote Logic Crash: {e}")
             threading.Thread(target=self.conn_mgr.remote_stop, daemon=True).start()
 
+    def _telemetry_hints(self, profile_name):
+        labels = self._telemetry_labels.get(profile_name)
+        if labels is None:
+            hints = self.remote.get_hints(profile_name)
+            has_triggers = any(k in hints for k in ["R2/L2", "L2", "R2", "THROTTLE_L", "THROTTLE_R"])
+            l_hint = f"{hints.get('DX', '')}/{hints.get('DY', '')}".strip("/") or "L"
+            r_hint = f"{hints.get('RX', '')}/{hints.get('RY', '')}".strip("/") or "R"
+            t_hint = hints.get("R2/L2", hints.get("L2", "Throttle"))
+            labels = (has_triggers, l_hint, r_hint, f"L2: {t_hint}", f"R2: {t_hint}")
+            self._telemetry_labels[profile_name] = labels
+        return labels
+
     def _draw_controller_telemetry(self):
         self.input.update_smoothing()
         
-        hints = self.remote.get_hints(self.active_profile)
-
-        lx = self.input.get_axis_float("DX")
-        ly = self.input.get_axis_float("DY")
-        rx = self.input.get_axis_float("RX")
-        ry = self.input.get_axis_float("RY")
-        l2 = self.input.get_axis_float("L2")
-        r2 = self.input.get_axis_float("R2")
-
-        rad = 50
-        spacing = 160
-        base_y = self.ui.screen_height // 2
-
-        has_triggers = any(k in hints for k in ["R2/L2", "L2", "R2", "THROTTLE_L", "THROTTLE_R"])
-
-        if has_triggers:
-            start_x = (self.ui.screen_width - (spacing + 180)) // 2
-        else:
-            start_x = (self.ui.screen_width - spacing) // 2
+        has_triggers, l_hint, r_hint, l2_hint, r2_hint = self._telemetry_hints(self.active_profile)
+        left_pos, right_pos, l2_pos, r2_pos = telemetry_layout(
+            self.ui.screen_width, self.ui.screen_height, has_triggers
+        )
 
-        l_hint = f"{hints.get('DX', '')}/{hints.get('DY', '')}".strip("/")
-        self.ui.draw_joystick_monitor((start_x, base_y), rad, lx, ly, l_hint or "L")
-        
-        r_hint = f"{hints.get('RX', '')}/{hints.get('RY', '')}".strip("/")
-        self.ui.draw_joystick_monitor((start_x + spacing, base_y), rad, rx, ry, r_hint or "R")
+        get_axis = self.input.get_axis_float
+        self.ui.draw_joystick_monitor(left_pos, TELEMETRY_RADIUS, get_axis("DX"), get_axis("DY"), l_hint)
+        self.ui.draw_joystick_monitor(right_pos, TELEMETRY_RADIUS, get_axis("RX"), get_axis("RY"), r_hint)
 
         if has_triggers:
-            trigger_w, trigger_h = 25, 100
-            trigger_gap = 100
-            trigger_base_x = start_x + spacing + 100
-            t_hint = hints.get("R2/L2", hints.get("L2", "Throttle"))
-            
-            self.ui.draw_trigger_gauge(
-                (trigger_base_x, base_y - (trigger_h // 2)), 
-                (trigger_w, trigger_h), 
-                l2, f"L2: {t_hint}"
-            )
-            self.ui.draw_trigger_gauge(
-                (trigger_base_x + trigger_gap, base_y - (trigger_h // 2)), 
-                (trigger_w, trigger_h), 
-                r2, f"R2: {t_hint}"
-            )
+            self.ui.draw_trigger_gauge(l2_pos, TRIGGER_SIZE, get_axis("L2"), l2_hint)
+            self.ui.draw_trigger_gauge(r2_pos, TRIGGER_SIZE, get_axis("R2"), r2_hint)
 
     def start(self):
         threading.Thread(target=self._monitor_input, name="InputThread", daemon=True).start()
 
     def update(self):
+        # Snapshot this frame's presses once; ui_key() reads the snapshot without locking
+        self.input.begin_frame()
+
         # Handle Auto-Transition to Connected View
         if self.conn_mgr.is_connected and not self.conn_mgr.is_connecting:
             # We check if we are NOT in the connected view yet
-            if self.current_view != "connected":
+            if self.current_view != View.CONNECTED:
                 print(f"[UI] Connection confirmed to {self.conn_mgr.active_name}. Switching views.")
-                self.current_view = "connected"
+                self.current_view = View.CONNECTED
                 self.submenu = None
                 self.idx = 0
                 self.connected_idx = 0
 
         # Handle Auto-Revert on Connection Loss
         # Only revert if we aren't currently trying to connect
-        if (self.current_view == "connected" or self.submenu) and not self.conn_mgr.is_connected:
+        if (self.current_view == View.CONNECTED or self.submenu is not None) and not self.conn_mgr.is_connected:
             if not self.conn_mgr.is_connecting:
                 self._reset_to_main(UI_STRINGS["CONN_LOST"])
 
@@ -748,14 +973,26 @@ class DroidToolbox:
             self._show_progress(err)
 
         # Render Logic
-        target = self.submenu if self.submenu else self.current_view
-        render, update_func = self.view_map.get(target, (None, None))
+        target = self.submenu if self.submenu is not None else self.current_view
+
+        self._view_formatter = self._formatters[target]
+
+        # One read of the published scan tuple serves both render and update
+        if target == View.SCAN:
+            self._scan_results = self.scan_mgr.get_results()
+            if self._scan_results:
+                self.idx = min(self.idx, len(self._scan_results) - 1)
 
-        if render: render()
-        if update_func: update_func()
+        if self._needs_render(target):
+            self.ui.draw_start()
+            self._renders[target]()
+            self._dirty = False
+            self._last_render_view = target
+        self._updates[target]()
 
     def cleanup(self) -> None:
         self.running = False
         self.beacon_mgr.stop()
+        self.options_mgr.close()
         if self.conn_mgr.is_connected:
             threading.Thread(target=self.conn_mgr.disconnect_droid, daemon=True).start()
\ No newline at end of file
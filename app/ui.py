@@ -8,7 +8,6 @@ import ctypes
 import os
 import sys
 import time
-from itertools import cycle
 from typing import List, Optional, Tuple, Any
 
 import sdl2
@@ -113,14 +112,15 @@ class UserInterface:
         self._scroll_start_delay = 60
         self._scroll_end_delay = 60
 
+        # Set while a marquee row is scrolling so the caller keeps redrawing
+        self.animating = False
+
         # LRU texture cache: path -> texture
         self.texture_cache = collections.OrderedDict()
         
-        # Animated spinner
-        self.spinner = cycle(["|", "/", "-", "\\"])
-        self.spinner_speed = 0.12
-        self.last_spinner = 0.0
-        self.spinner_frame = "|"
+        # Animated spinner, the frame is derived from the clock
+        self._spinner_frames = ("|", "/", "-", "\\")
+        self._spinner_rate = 8.0
         
         # Finalize init
         self.draw_clear()
@@ -154,6 +154,7 @@ class UserInterface:
     # Frame management
     # ------------------------------------------------------------------
     def draw_start(self):
+        self.animating = False
         sdl2.SDL_SetRenderDrawColor(self.renderer, 0, 0, 0, 255)
         sdl2.SDL_RenderClear(self.renderer)
         sdl2.SDL_SetRenderTarget(self.renderer, self.screen_texture)
@@ -306,12 +307,14 @@ class UserInterface:
     # ------------------------------------------------------------------
     # UI Components
     # ------------------------------------------------------------------
-    def spin(self):
-        """ Animates the spinner in draw_status_footer """
-        now = time.time()
-        if now - self.last_spinner >= self.spinner_speed:
-            self.last_spinner = now
-            self.spinner_frame = next(self.spinner)
+    def spinner_index(self) -> int:
+        """ Index of the spinner frame for the current time """
+        return int(time.monotonic() * self._spinner_rate) % len(self._spinner_frames)
+
+    @property
+    def spinner_frame(self) -> str:
+        """ Spinner character shown in draw_status_footer """
+        return self._spinner_frames[self.spinner_index()]
 
     def row_list(self, text: str, pos: Tuple[float, float], width: int, height: int,
         selected: bool = False, fill: Optional[sdl2.SDL_Color] = None,
@@ -341,6 +344,7 @@ class UserInterface:
             if text_w <= width - 20:
                 self.draw_text((ix + padding_left, render_y), text, color)
             else:
+                self.animating = True
                 state = self._row_scroll_state.get(text, {
                     "offset": 0, 
                     "direction": 1, 